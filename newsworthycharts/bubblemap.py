@@ -2,8 +2,6 @@
 Simple bubble map for common administrative areas
 """
 from .map import Map
-from shapely.geometry.multipolygon import MultiPolygon
-import geopandas as gpd
 
 
 class BubbleMap(Map):
@@ -25,6 +23,10 @@ class BubbleMap(Map):
         self.bubble_size = kwargs.get("bubble_size", 1)
 
     def _add_data(self):
+        # Deferred imports: geopandas (which brings shapely along) pulls
+        # in a lot, and maps are a small share of the charts rendered
+        import geopandas as gpd
+        from shapely.geometry.multipolygon import MultiPolygon
 
         df = self._prepare_map_data()
 
@@ -1,6 +1,7 @@
 """ Create charts and store them as images.
 For use with Newsworthy's robot writer and other similar projects.
 """
+import os
 import types
 from .lib import color_fn
 from .lib.mimetypes import MIME_TYPES
@@ -387,14 +388,30 @@ class Chart(object):
             self.ax.xaxis.set_major_locator(loc)
             formatter = Formatter(self._language)
 
+            # The closures below run once per tick and draw, so do the
+            # x point bookkeeping once out here (data.x_points re-sorts on
+            # every access), and cache the Babel-formatted labels
+            x_points = self.data.x_points
+            n_points = len(x_points)
+            x_points_set = frozenset(x_points)
+            label_cache = {}
+
+            def _date_label(d, pattern):
+                key = (d, pattern)
+                label = label_cache.get(key)
+                if label is None:
+                    label = formatter.date(d, pattern)
+                    label_cache[key] = label
+                return label
+
             # if isinstance(loc, WeekdayLocator):
             if self.interval == "weekly":
                 # We consider dates to be more informative than week numbers
                 def fmt(x, pos):
-                    if pos > len(self.data.x_points):
+                    if pos > n_points:
                         return None
                     try:
-                        return formatter.date(self.data.x_points[pos], "d MMM")
+                        return _date_label(x_points[pos], "d MMM")
                     except IndexError:
                         return None
                 # fmt = DateFormatter('%-d %b')
@@ -402,29 +419,29 @@ class Chart(object):
             elif self.interval in ["monthly", "quarterly"]:
                 def fmt(x, pos):
                     d = num2date(x).isoformat()[:10]
-                    if d not in self.data.x_points:
+                    if d not in x_points_set:
                         return None
-                    if pos > len(self.data.x_points):
+                    if pos > n_points:
                         return None
-                    if len(self.data.x_points) > 12 and d[5:7] == "01":
-                        return formatter.date(d, "MMM\ny")
+                    if n_points > 12 and d[5:7] == "01":
+                        return _date_label(d, "MMM\ny")
                     else:
-                        return formatter.date(d, "MMM")
+                        return _date_label(d, "MMM")
                 # fmt = DateFormatter('%b')
 
             # elif isinstance(loc, DayLocator):
             elif self.interval == "daily":
                 def fmt(x, pos):
                     d = num2date(x).isoformat()[:10]
-                    if pos > len(self.data.x_points):
+                    if pos > n_points:
                         return None
                     try:
-                        if len(self.data.x_points) > 7:
-                            return formatter.date(d, "d MMM")
+                        if n_points > 7:
+                            return _date_label(d, "d MMM")
                         elif pos == 0:
-                            return formatter.date(d, "EE d/M")
+                            return _date_label(d, "EE d/M")
                         else:
-                            return formatter.date(d, "EEE")
+                            return _date_label(d, "EEE")
                     except IndexError:
                         return None
             else:
@@ -650,6 +667,11 @@ class Chart(object):
                 'Author': "Newsworthy",
                 'Software': f"NWCharts {__version__}",
             }
+            if os.environ.get("NWC_PNG_FAST"):
+                # Trade some file size for a much cheaper zlib pass.
+                # Used by the test suite, where PNG encoding dominates
+                # render time.
+                args["pil_kwargs"] = {"compress_level": 1}
         elif img_format == "svg":
             args["metadata"] = {
                 'Publisher': "Newsworthy",
@@ -699,6 +721,8 @@ class Chart(object):
                     'Author': "Newsworthy",
                     'Software': f"NWCharts {__version__}",
                 }
+                if os.environ.get("NWC_PNG_FAST"):
+                    args["pil_kwargs"] = {"compress_level": 1}
             elif file_format == "svg":
                 args["metadata"] = {
                     'Publisher': "Newsworthy",
@@ -2,10 +2,8 @@
 Simple choropleths for common administrative areas
 """
 from .map import Map
-import geopandas as gpd
 import numpy as np
 import pandas as pd
-import mapclassify
 
 
 class ChoroplethMap(Map):
@@ -26,6 +24,10 @@ class ChoroplethMap(Map):
         super(ChoroplethMap, self).__init__(*args, **kwargs)
 
     def _add_data(self):
+        # Deferred imports: geopandas and mapclassify pull in a lot,
+        # and maps are a small share of the charts rendered
+        import geopandas as gpd
+        import mapclassify
 
         df = self._prepare_map_data()
 
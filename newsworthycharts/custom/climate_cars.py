@@ -1,8 +1,10 @@
 """Custom charts for climate report on cars
 """
 
+import warnings
 from math import atan2, degrees
 import numpy as np
+from matplotlib.dates import date2num, num2date
 from newsworthycharts import SerialChart
 from datetime import datetime
 
@@ -65,7 +67,8 @@ class ClimateCarsYearlyEmissionsTo2030(SerialChart):
         )
 
         # Scenario 1
-        i_2030 = line_scen1.get_xdata().tolist().index(datetime(2030, 1, 1))
+        # SerialChart plots x values as matplotlib date numbers
+        i_2030 = line_scen1.get_xdata().tolist().index(date2num(datetime(2030, 1, 1)))
 
         self.ax.annotate(
             self.labels[1],
@@ -105,7 +108,7 @@ class ClimateCarsYearlyEmissionsTo2030(SerialChart):
         lines = self.ax.get_lines()[:2]
         labels = ['Historiska utsläpp', 'Utsläppsscenarier']
         self.ax.legend(lines, labels)
-        tick_years = [line_observed.get_xdata()[0].year, 2010, 2020, 2030, 2045]
+        tick_years = [num2date(line_observed.get_xdata()[0]).year, 2010, 2020, 2030, 2045]
         self.ax.set_xticks([datetime(x, 1, 1) for x in tick_years])
 
 
@@ -233,7 +236,7 @@ def label_line(line, x, label=None, align=True, **kwargs):
     ydata = line.get_ydata()
 
     if (x < xdata[0]) or (x > xdata[-1]):
-        print('x label location is outside data range!')
+        warnings.warn('x label location is outside data range!')
         return
 
     # Find corresponding y co-ordinate and angle of the line
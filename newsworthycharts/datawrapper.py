@@ -2,6 +2,8 @@ from babel import Locale
 import os
 from langcodes import standardize_tag
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from io import BytesIO, StringIO
 import csv
@@ -14,6 +16,17 @@ from .lib.datalist import DataList
 
 HERE = os.path.dirname(__file__)
 
+# requests.Session is not thread-safe, so hand out one per thread:
+# each still reuses its TLS connection to the DW API between calls,
+# including across render_all's concurrent export workers
+_thread_local = threading.local()
+
+
+def _get_session():
+    if not hasattr(_thread_local, "session"):
+        _thread_local.session = requests.Session()
+    return _thread_local.session
+
 
 class DatawrapperChart(Chart):
     # TODO: Make file_types dynami. Available file types depend on the
@@ -69,19 +82,32 @@ class DatawrapperChart(Chart):
         # For renaming regions to DW conventions
         self._translations = None
 
-    def render(self, key: str, img_format: str, **kwargs):
-        """Render file, and send to storage."""
-
-        # Save plot in memory, to write it directly to storage
-        auth_header = {
+    @property
+    def _auth_header(self):
+        return {
             "Authorization": f"Bearer {self.api_token}"
         }
+
+    def render(self, key: str, img_format: str, **kwargs):
+        """Render file, and send to storage.
+
+        The Datawrapper chart is created and filled with data on the
+        first call only; further calls (e.g. additional formats from
+        render_all) reuse it and just trigger new exports.
+        """
+        if self._dw_id is None:
+            self._create_dw_chart()
+        self._export_dw_chart(key, img_format)
+
+    def _create_dw_chart(self):
+        """Create the chart and upload its data through the DW API."""
+        auth_header = self._auth_header
         url = "https://api.datawrapper.de/v3/charts"
 
         # 1. create chart with metadata
         dw_data = self._prepare_dw_metadata(self.dw_data)
         # print(dw_data)
-        r = requests.post(url, headers=auth_header, json=dw_data)
+        r = _get_session().post(url, headers=auth_header, json=dw_data)
         try:
             r.raise_for_status()
         except Exception():
@@ -91,9 +117,6 @@ class DatawrapperChart(Chart):
         self._dw_id = r.json()["id"]
         chart_id = self._dw_id
 
-        url = f"https://api.datawrapper.de/v3/charts/{chart_id}"
-        r = requests.get(url, headers=auth_header)
-
         # 2. add data
         # print("Add data")
         url = f"https://api.datawrapper.de/v3/charts/{chart_id}/data"
@@ -101,9 +124,14 @@ class DatawrapperChart(Chart):
 
         headers = deepcopy(auth_header)
         headers['content-type'] = 'text/csv; charset=UTF-8'
-        r = requests.put(url, headers=headers, data=csv_data)
+        r = _get_session().put(url, headers=headers, data=csv_data)
         r.raise_for_status()
 
+    def _export_dw_chart(self, key: str, img_format: str):
+        """Export the created chart in one format, and send to storage."""
+        auth_header = self._auth_header
+        chart_id = self._dw_id
+
         # 3. render (and store) chart
         # print("Store chart")
         url = f"https://api.datawrapper.de/v3/charts/{chart_id}/export/{img_format}"
@@ -122,7 +150,7 @@ class DatawrapperChart(Chart):
         headers = deepcopy(auth_header)
         headers['accept'] = f'image/{img_format}'
 
-        r = requests.post(url, json=params, headers=headers, stream=True)
+        r = _get_session().post(url, json=params, headers=headers, stream=True)
         r.raise_for_status()
         buf = BytesIO(r.content)
         buf.seek(0)
@@ -132,9 +160,20 @@ class DatawrapperChart(Chart):
         """
         Render all available formats
         """
-
-        for file_format in self.file_types:
-            self.render(key, file_format)
+        if self._dw_id is None:
+            self._create_dw_chart()
+
+        # The per-format exports are independent, network-bound calls,
+        # so run them concurrently
+        if len(self.file_types) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.file_types)) as ex:
+                for _ in ex.map(
+                        lambda fmt: self._export_dw_chart(key, fmt),
+                        self.file_types):
+                    pass
+        else:
+            for file_format in self.file_types:
+                self._export_dw_chart(key, file_format)
 
         # In addition to regular format we store the Datawrapper chart
         # id in a basic text file to be able to to embeds.
@@ -1,18 +1,20 @@
 # Default colors
-STRONG = "5aa69d"  # primary color (for highlighting etc)
-NEUTRAL = "999999"
-POSITIVE = "47b358"
-NEGATIVE = "ec6b56"
-FILL_BETWEEN = "F7F4F4"
-WARM = "ff808f"
-COLD = "4062bb"
+# Stored ready-to-use, with a leading '#', so consumers don't have to
+# prefix them at every use
+STRONG = "#5aa69d"  # primary color (for highlighting etc)
+NEUTRAL = "#999999"
+POSITIVE = "#47b358"
+NEGATIVE = "#ec6b56"
+FILL_BETWEEN = "#F7F4F4"
+WARM = "#ff808f"
+COLD = "#4062bb"
 
-BLACK = "0F1108"
-DARK_GRAY = "42404F"
-LIGHT_GRAY = "C8C7D1"
+BLACK = "#0F1108"
+DARK_GRAY = "#42404F"
+LIGHT_GRAY = "#C8C7D1"
 
 # For categorical coloring
 # picked from color brewer, but without too much thought...
 # Can be overridden with style file
-QUALITATIVE = ["66c2a5", "fc8d62", "8da0cb", "e78ac3", "a6d854", "ffd92f",
-               "e5c494", "b3b3b3"]
+QUALITATIVE = ("#66c2a5", "#fc8d62", "#8da0cb", "#e78ac3", "#a6d854",
+               "#ffd92f", "#e5c494", "#b3b3b3")
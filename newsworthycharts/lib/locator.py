@@ -4,6 +4,7 @@ from matplotlib.dates import (YearLocator, MonthLocator, DayLocator,
                               WeekdayLocator)
 from datetime import datetime
 from dateutil.rrule import MO
+from functools import lru_cache
 
 
 def get_year_ticks(start_date, end_date, max_ticks=5):
@@ -22,10 +23,13 @@ def get_year_ticks(start_date, end_date, max_ticks=5):
     # -2 for the ends
     # +1 because cutting a cake in n+1 pieces gives n cuts
     if max_ticks > 1:
-        cuts = n_years / (max_ticks - 2 + 1)
+        n_cuts = max_ticks - 2 + 1
+        # (x * n_years) // n_cuts is exact integer arithmetic, where
+        # multiplying by a float quotient could round either way
+        selected_years = [years[x * n_years // n_cuts]
+                          for x in range(0, max_ticks - 1)]
     else:
-        cuts = 0
-    selected_years = [years[int(x * cuts)] for x in range(0, max_ticks - 1)]
+        selected_years = []
 
     # add last year
     if max_ticks > 0:
@@ -42,47 +46,73 @@ def get_best_locator(delta, points, interval=None):
     trying to keep the x axis as clean as possible, while still including
     enough clues for the reader to easily understand the graph.
     """
-    if delta.days > 365 * 150:
-        return YearLocator(100)
-    elif delta.days > 365 * 45:
-        return YearLocator(20)
-    elif delta.days > 500:
-        if points > 20:
-            return YearLocator(10)
-        elif points > 10:
-            return YearLocator(5)
-        elif points > 5:
-            return YearLocator(2)
-        else:
-            return YearLocator()
+    spec = _get_best_locator_spec(delta.days, points, interval)
+    if spec is None:
+        return None
+    # Locators bind to a single axis (set_major_locator calls
+    # locator.set_axis), so every call must get a fresh instance;
+    # only the decision above is cached
+    cls, args, kwargs = spec
+    return cls(*args, **kwargs)
+
+
+def _year_locator_by_points(points):
+    if points > 20:
+        year_interval = 10
+    elif points > 10:
+        year_interval = 5
+    elif points > 5:
+        year_interval = 2
     else:
-        # Less than a year:
-        if interval in ["monthly", "quarterly"]:
-            if points > 12:
-                return MonthLocator()
-            else:
-                return MonthLocator()
-
-        elif interval == "weekly":
-            # NB The threshold are not tested thoroughly. Consider adjusting.
-            if delta.days <= 10 * 7:
-                return WeekdayLocator(MO, interval=1)
-
-            elif delta.days <= 20 * 7:
-                return WeekdayLocator(MO, interval=2)
-
-            elif delta.days <= 30 * 7:
-                return WeekdayLocator(MO, interval=3)
-
-            else:
-                return WeekdayLocator(MO, interval=4)
-
-        elif interval == "daily" or interval is None:
-            if delta.days > 30:
-                return MonthLocator()
-            elif delta.days > 21:
-                return DayLocator(interval=10)
-            elif delta.days > 7:
-                return DayLocator(interval=5)
-            else:
-                return DayLocator()
+        year_interval = 1
+    return (YearLocator, (year_interval,), {})
+
+
+# Single source of truth for the multi-year spans:
+# the first entry whose day threshold is exceeded wins
+_YEAR_SPAN_TABLE = (
+    (365 * 150, lambda points: (YearLocator, (100,), {})),
+    (365 * 45, lambda points: (YearLocator, (20,), {})),
+    (500, _year_locator_by_points),
+)
+
+
+@lru_cache(maxsize=32)
+def _get_best_locator_spec(days, points, interval):
+    """ Pick locator class and arguments for get_best_locator.
+
+    Batch rendering tends to hit the same (days, points, interval)
+    buckets over and over, so the decision is cached. Returns a
+    (class, args, kwargs) tuple, or None.
+    """
+    for threshold, make_spec in _YEAR_SPAN_TABLE:
+        if days > threshold:
+            return make_spec(points)
+
+    # Less than a year:
+    if interval in ["monthly", "quarterly"]:
+        return (MonthLocator, (), {})
+
+    elif interval == "weekly":
+        # NB The threshold are not tested thoroughly. Consider adjusting.
+        if days <= 10 * 7:
+            return (WeekdayLocator, (MO,), {"interval": 1})
+
+        elif days <= 20 * 7:
+            return (WeekdayLocator, (MO,), {"interval": 2})
+
+        elif days <= 30 * 7:
+            return (WeekdayLocator, (MO,), {"interval": 3})
+
+        else:
+            return (WeekdayLocator, (MO,), {"interval": 4})
+
+    elif interval == "daily" or interval is None:
+        if days > 30:
+            return (MonthLocator, (), {})
+        elif days > 21:
+            return (DayLocator, (), {"interval": 10})
+        elif days > 7:
+            return (DayLocator, (), {"interval": 5})
+        else:
+            return (DayLocator, (), {})
@@ -1,8 +1,14 @@
 """ Various utility methods """
 import os
 from datetime import datetime
+from functools import lru_cache
 import numpy as np
 import yaml
+try:
+    # libyaml parses even tiny documents noticeably faster
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 from matplotlib import rc_file, rcParams
 from matplotlib.colors import to_rgba, cnames, to_rgb
 import matplotlib.patheffects as pe
@@ -19,25 +25,58 @@ class StyleNotFoundError(FileNotFoundError):
     pass
 
 
+def _to_rgba(color, alpha=1):
+    """Parse a hex color string, with or without a leading '#'.
+
+    Style files use bare hex strings, while our default color constants
+    come ready-prefixed.
+    """
+    color = str(color)
+    if not color.startswith("#"):
+        color = "#" + color
+    return to_rgba(color, alpha)
+
+
 def loadstyle(style_name):
     """ Load a custom style file, adding both rcParams and custom params.
     Writing a proper parser for these settings is in the Matplotlib backlog,
     so let's keep calm and avoid inventing their wheel.
     """
+    style, nwc_styles = _loadstyle(style_name)
+    # _loadstyle only ran rc_file on the first call for this style, so
+    # re-apply the params to keep the global rcParams side effect
+    rcParams.update(style)
+    # Copies, so callers can't poison the cache. qualitative_colors is
+    # the only mutable value and needs copying separately; everything
+    # else in the dicts is immutable.
+    nwc_styles = dict(
+        nwc_styles,
+        qualitative_colors=list(nwc_styles["qualitative_colors"]),
+    )
+    return style.copy(), nwc_styles
+
+
+@lru_cache(maxsize=32)
+def _loadstyle(style_name):
+    """Do the actual file parsing for loadstyle.
 
+    Style files are static at install time, so results are cached on the
+    style name: charts rendered in a batch all pay for the file I/O and
+    YAML parsing only once.
+    """
     style = {}
     nwc_styles = {}  # for backwards compatibility
+    # Check rc directory for built in styles first,
+    # then current working dir or path
     style_file = os.path.join(HERE, '..', 'rc', style_name)
+    if not os.path.isfile(style_file):
+        style_file = style_name
     try:
-        # Check rc directory for built in styles first
+        # rc_file insists on opening the path itself, so this is one of
+        # two reads of the file (the other harvests the `#!` lines below)
         rc_file(style_file)
-    except FileNotFoundError:
-        # Check current working dir or path
-        style_file = style_name
-        try:
-            rc_file(style_file)
-        except FileNotFoundError as err:
-            raise StyleNotFoundError(f"No such style file found: {err}")
+    except FileNotFoundError as err:
+        raise StyleNotFoundError(f"No such style file found: {err}")
     style = rcParams.copy()
 
     # The style files may also contain an extra section with typography
@@ -46,10 +85,10 @@ def loadstyle(style_name):
     # This is a hack, but it's nice to have all styling in one file
     # The extra styling is prefixed with `#!`
     with open(style_file, 'r') as file_:
-        doc = file_.readlines()
-        rc_params_newsworthy = "\n".join([d[2:]
-                                          for d in doc if d.startswith("#!")])
-    rc_params_newsworthy = yaml.safe_load(rc_params_newsworthy)
+        rc_params_newsworthy = "\n".join(line[2:]
+                                         for line in file_
+                                         if line.startswith("#!"))
+    rc_params_newsworthy = yaml.load(rc_params_newsworthy, Loader=YamlLoader)
     ###
     # Typography
     ###
@@ -93,32 +132,39 @@ def loadstyle(style_name):
     cold_color = rc_params_newsworthy.get("cold_color", COLD)
     fill_between_color = rc_params_newsworthy.get("fill_between_color", FILL_BETWEEN)
     fill_between_alpha = rc_params_newsworthy.get("fill_between_alpha", 0.5)
-    nwc_styles["black_color"] = to_rgba("#" + str(black_color), 1)
-    nwc_styles["dark_gray_color"] = to_rgba("#" + str(dark_gray_color), 1)
-    nwc_styles["light_gray_color"] = to_rgba("#" + str(light_gray_color), 1)
-    nwc_styles["neutral_color"] = to_rgba("#" + str(color), 1)
-    nwc_styles["strong_color"] = to_rgba("#" + str(strong_color), 1)
-    nwc_styles["positive_color"] = to_rgba("#" + positive_color, 1)
-    nwc_styles["negative_color"] = to_rgba("#" + negative_color, 1)
-    nwc_styles["warm_color"] = to_rgba("#" + warm_color, 1)
-    nwc_styles["cold_color"] = to_rgba("#" + cold_color, 1)
-    nwc_styles["fill_between_color"] = to_rgba("#" + str(fill_between_color), 1)
+    nwc_styles["black_color"] = _to_rgba(black_color)
+    nwc_styles["dark_gray_color"] = _to_rgba(dark_gray_color)
+    nwc_styles["light_gray_color"] = _to_rgba(light_gray_color)
+    nwc_styles["neutral_color"] = _to_rgba(color)
+    nwc_styles["strong_color"] = _to_rgba(strong_color)
+    nwc_styles["positive_color"] = _to_rgba(positive_color)
+    nwc_styles["negative_color"] = _to_rgba(negative_color)
+    nwc_styles["warm_color"] = _to_rgba(warm_color)
+    nwc_styles["cold_color"] = _to_rgba(cold_color)
+    nwc_styles["fill_between_color"] = _to_rgba(fill_between_color)
     nwc_styles["fill_between_alpha"] = float(fill_between_alpha)
 
     if "qualitative_colors" in rc_params_newsworthy:
         nwc_styles["qualitative_colors"] = [
-            to_rgba("#" + c.strip(), 1)
+            _to_rgba(c.strip())
             for c in rc_params_newsworthy["qualitative_colors"].split(",")
         ]
 
     else:
-        nwc_styles["qualitative_colors"] = [to_rgba("#" + c, 1) for c in QUALITATIVE]
+        nwc_styles["qualitative_colors"] = [to_rgba(c, 1) for c in QUALITATIVE]
     if "logo" in rc_params_newsworthy:
         nwc_styles["logo"] = rc_params_newsworthy["logo"]
 
     return style, nwc_styles
 
 
+def has_duplicates(iterable):
+    """Return True as soon as a duplicate value is seen."""
+    seen = set()
+    add = seen.add
+    return any(x in seen or add(x) for x in iterable)
+
+
 def to_float(val):
     """Convert string to float, but also handles None and 'null'."""
     if val is None:
@@ -128,10 +174,15 @@ def to_float(val):
     return float(val)
 
 
+@lru_cache(maxsize=4096)
 def to_date(val):
     """Convert date string to datetime date.
 
     Integers are interpreted as years.
+
+    Parse results are cached: charts typically convert the same timepoint
+    strings several times (interval guessing, plotting, axis set-up), and
+    date string parsing is slow. Safe, since datetimes are immutable.
     """
     if np.issubdtype(type(val), np.integer) and val < 3000:
         return datetime(val, 1, 1)
@@ -166,23 +217,39 @@ def guess_date_interval(data):
     interval = "yearly"
     for serie in data:
         dates = [to_date(x[0]) for x in serie]
-        years = [x.year for x in dates]
-        months = [x.month for x in dates]
-        yearmonths = [x.strftime("%Y-%m") for x in dates]
-        weeks = [str(x.year) + str(x.isocalendar()[1]) for x in dates]
-        if len(years) > len(set(years)):
-            # there are years with more than one point
-            unique_months = sorted(list(set(months)))
-            if len(unique_months) == 4 \
-                    and unique_months[0] + 3 == unique_months[1] \
-                    and unique_months[1] + 3 == unique_months[2] \
-                    and unique_months[2] + 3 == unique_months[3]:
-                # all in all four months, and they are non-conscutive
-                interval = "quarterly"
+        # Cheap test first: unless some year holds more than one point,
+        # the data is yearly and the month/week bookkeeping (including the
+        # comparatively slow isocalendar() calls) can be skipped entirely
+        if not has_duplicates(d.year for d in dates):
+            continue
+        # there are years with more than one point
+        seen_yearmonths = set()
+        seen_yearweeks = set()
+        months = set()
+        dup_yearmonths = dup_yearweeks = False
+        for d in dates:
+            yearmonth = (d.year, d.month)
+            if yearmonth in seen_yearmonths:
+                dup_yearmonths = True
+            else:
+                seen_yearmonths.add(yearmonth)
+            yearweek = (d.year, d.isocalendar()[1])
+            if yearweek in seen_yearweeks:
+                dup_yearweeks = True
             else:
-                interval = "monthly"
-                if len(yearmonths) > len(set(yearmonths)):
-                    interval = "weekly"
-                if len(weeks) > len(set(weeks)):
-                    interval = "daily"
+                seen_yearweeks.add(yearweek)
+            months.add(d.month)
+        unique_months = sorted(months)
+        if len(unique_months) == 4 \
+                and unique_months[0] + 3 == unique_months[1] \
+                and unique_months[1] + 3 == unique_months[2] \
+                and unique_months[2] + 3 == unique_months[3]:
+            # all in all four months, and they are non-conscutive
+            interval = "quarterly"
+        else:
+            interval = "monthly"
+            if dup_yearmonths:
+                interval = "weekly"
+            if dup_yearweeks:
+                interval = "daily"
     return interval
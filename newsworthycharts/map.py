@@ -4,8 +4,6 @@ Base class for maps
 from .chart import Chart
 from .lib.geography import haversine
 from .translations.regions import NW_MUNI_TO_CLDR
-from fiona.errors import DriverError
-import geopandas as gpd
 import pathlib
 
 
@@ -138,6 +136,10 @@ class Map(Chart):
             [base_map, subset] = _
 
         if self.df is None:
+            # Deferred imports: geopandas pulls in a lot, and maps are
+            # a small share of the charts rendered
+            import geopandas as gpd
+            from fiona.errors import DriverError
             __dir = pathlib.Path(__file__).parent.resolve()
             try:
                 self.df = gpd.read_file(f"{__dir}/maps/{base_map}-{subdivisions}.gpkg")
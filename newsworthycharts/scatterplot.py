@@ -1,6 +1,5 @@
 from .chart import Chart
 
-from adjustText import adjust_text
 from matplotlib.ticker import MaxNLocator
 
 
@@ -32,6 +31,9 @@ class ScatterPlot(Chart):
         self.xmin = None
 
     def _add_data(self):
+        # Deferred import: only scatterplots need label adjustment
+        from adjustText import adjust_text
+
         # Set up axes
         x_formatter = self._get_formatter(self.units_x)
         y_fomatter = self._get_formatter(self.units_y)
@@ -30,16 +30,20 @@ class SeasonalChart(SerialChart):
 
         color_s = self._nwc_style["dark_gray_color"]
         color_n = self._nwc_style["light_gray_color"]
-        colors = [color_s if x[0].endswith(date_suffix) else color_n
-                  for x in self.data[i]]
-
+        color_hl = self._nwc_style["strong_color"]
+        serie = self.data[i]
         # Highlight latest by default
         if self.highlight:
-            for i, d in enumerate(self.data[i]):
-                if d[0] == self.highlight:
-                    colors[i] = self._nwc_style["strong_color"]
+            # One pass assigns both the seasonal and the highlight colors
+            highlight = self.highlight
+            colors = [color_hl if x[0] == highlight
+                      else color_s if x[0].endswith(date_suffix)
+                      else color_n
+                      for x in serie]
         else:
-            colors[-1] = self._nwc_style["strong_color"]
+            colors = [color_s if x[0].endswith(date_suffix) else color_n
+                      for x in serie]
+            colors[-1] = color_hl
 
         # If we want to suppport multiple series
         # if i > 0:
@@ -1,11 +1,73 @@
 from .chart import Chart
-from .lib.utils import to_float, to_date, guess_date_interval
+from .lib.utils import to_float, to_date, guess_date_interval, has_duplicates
 
 import numpy as np
+import calendar
+from datetime import datetime
+from functools import lru_cache
 from math import inf
 from dateutil.relativedelta import relativedelta
-from adjustText import adjust_text
-from labellines import labelLines
+from matplotlib.dates import date2num
+
+# Typical number of days in a period, when we have no specific date
+_TYPICAL_DAYS = {
+    'yearly': 365,
+    'quarterly': 91,
+    'monthly': 30,
+    'weekly': 7,
+    'daily': 1,
+}
+
+
+# Period lengths only depend on the year/quarter/month, not the full
+# date, so memoize on those reduced keys: a series rarely spans more than
+# a handful of distinct periods, while relativedelta math is slow
+@lru_cache(maxsize=None)
+def _days_in_year(year):
+    return 366 if calendar.isleap(year) else 365
+
+
+@lru_cache(maxsize=None)
+def _days_in_quarter(year, month):
+    # NB: the three months starting at the date's own month, not the
+    # calendar quarter it falls in
+    start = datetime(year, month, 1)
+    return ((start + relativedelta(months=3)) - start).days
+
+
+@lru_cache(maxsize=None)
+def _days_in_month(year, month):
+    return calendar.monthrange(year, month)[1]
+
+
+# Dispatch table for _days_in, to avoid re-comparing interval strings
+# once per bar
+_DAYS_COMPUTERS = {
+    'yearly': lambda d: _days_in_year(d.year),
+    'quarterly': lambda d: _days_in_quarter(d.year, d.month),
+    'monthly': lambda d: _days_in_month(d.year, d.month),
+    # Assuming ISO 8601 here
+    'weekly': lambda d: 7,
+    'daily': lambda d: 1,
+}
+
+
+def _period_lengths(interval, dates):
+    """Return the number of days in each date's period, as a numpy array.
+
+    Vectorized equivalent of calling _days_in(interval, d) for each date:
+    datetime64 truncation replaces the per-bar relativedelta/replace() math.
+    """
+    if interval == "yearly":
+        starts = np.array(dates, dtype="datetime64[Y]")
+        ends = starts + np.timedelta64(1, "Y")
+    elif interval in ("quarterly", "monthly"):
+        starts = np.array(dates, dtype="datetime64[M]")
+        ends = starts + np.timedelta64(3 if interval == "quarterly" else 1, "M")
+    else:
+        # weekly/daily periods all have the same length
+        return np.full(len(dates), _TYPICAL_DAYS[interval])
+    return (ends.astype("datetime64[D]") - starts.astype("datetime64[D]")).astype(int)
 
 
 class SerialChart(Chart):
@@ -82,33 +144,10 @@ class SerialChart(Chart):
         29
         """
         if d is None:
-            return {
-                'yearly': 365,
-                'quarterly': 91,
-                'monthly': 30,
-                'weekly': 7,
-                'daily': 1,
-            }[interval]
+            return _TYPICAL_DAYS[interval]
         else:
             # https://stackoverflow.com/questions/4938429/how-do-we-determine-the-number-of-days-for-a-given-month-in-python
-
-            if interval == "yearly":
-                return (
-                    (d + relativedelta(years=1)).replace(day=1, month=1) - d.replace(day=1, month=1)
-                ).days
-            elif interval == "quarterly":
-                return (
-                    (d + relativedelta(months=3)).replace(day=1) - d.replace(day=1)
-                ).days
-            elif interval == "monthly":
-                return (
-                    (d + relativedelta(months=1)).replace(day=1) - d.replace(day=1)
-                ).days
-            elif interval == "weekly":
-                # Assuming ISO 8601 here
-                return 7
-            elif interval == "daily":
-                return 1
+            return _DAYS_COMPUTERS[interval](d)
 
     def _get_annotation_direction(self, index, values):
         """ Given an index and series of values, provide the estimated best
@@ -124,22 +163,44 @@ class SerialChart(Chart):
             else:
                 return "up"
         if index == num_vals - 1:
-            # get previous non-None value
-            latest_not_null = [x for x in values[:-1] if x is not None][-1]
+            # get previous non-None value, scanning backwards
+            # to avoid copying and filtering the whole series
+            latest_not_null = None
+            for j in range(num_vals - 2, -1, -1):
+                if values[j] is not None:
+                    latest_not_null = values[j]
+                    break
             if latest_not_null <= values[-1]:
                 return "up"
             else:
                 return "down"
-        val = values[index]
-        if val == max(values[index - 1:index + 2]):
+        # Compare directly against the two neighbours, rather than
+        # building slices and running max()/min() over them
+        prev, val, nxt = values[index - 1], values[index], values[index + 1]
+        if val >= prev and val >= nxt:
             return "up"
-        if val == min(values[index - 1:index + 2]):
+        if val <= prev and val <= nxt:
             return "down"
         return "up"
 
+    def _apply_color_fn(self, color_fn):
+        """Re-apply a color rule to already drawn bars, in place.
+
+        Recoloring existing patches is much cheaper than a full
+        re-render when only the color rule changes.
+        """
+        self.color_fn = color_fn
+        # to_float, to mirror the treatment values get on a full render
+        values = [to_float(x[1]) for x in self.data[0]]
+        for patch, value in zip(self.ax.patches, values):
+            patch.set_facecolor(self._color_by(value, baseline=self.baseline))
+
     def _add_data(self):
 
         series = self.data
+        # This method reads style colors all over; one attribute lookup
+        # here replaces hundreds inside the per-series loops
+        style = self._nwc_style
 
         # For backwards compatibility: Convert type = "line" -> type = ["line"]
         if type(self.type) is str:
@@ -155,14 +216,17 @@ class SerialChart(Chart):
         # parse values
         serie_values = []
         for i, serie in enumerate(series):
+            # Unpack both columns in a single pass over the tuple list
+            _timepoints, _value_strs, _ = zip(*serie)
             # make sure all timepoints are unique
-            _timepoints = [x[0] for x in serie]
-            if len(_timepoints) > len(set(_timepoints)):
-                raise ValueError(f"Duplicated timepoints: {_timepoints}")
-            _values = [to_float(x[1]) for x in serie]
+            if has_duplicates(_timepoints):
+                raise ValueError(f"Duplicated timepoints: {list(_timepoints)}")
+            _values = list(map(to_float, _value_strs))
             if self.type[i] == "bars":
-                # Replace None values with 0's to be able to plot bars
-                _values = [0 if v is None else v for v in _values]
+                # Replace None values with 0's to be able to plot bars.
+                # None becomes nan in the float array, and nan_to_num
+                # zeroes them in a single vectorized pass.
+                _values = np.nan_to_num(np.array(_values, dtype=float), copy=False)
             serie_values.append(_values)
 
         #  Select a date to highlight
@@ -180,7 +244,9 @@ class SerialChart(Chart):
 
         # Formatters for axis and annotations
         y_formatter = self._get_value_axis_formatter()
-        a_formatter = self._get_annotation_formatter()
+        # Babel-backed formatting is slow, and annotated values repeat
+        # (highlights, value labels, trendline points), so memoize per value
+        a_formatter = lru_cache(maxsize=1024)(self._get_annotation_formatter())
 
         # Store y values while we are looping the data, to adjust axis,
         # and highlight diff
@@ -194,20 +260,34 @@ class SerialChart(Chart):
         line_label_elems = []
         value_label_elems = []
 
+        if is_stacked:
+            # The cumulative sums are the same for every series, so compute
+            # them once here rather than once per stacked series below
+            cum_values = np.cumsum(np.asarray(serie_values, dtype=float), axis=0)
+
+        if "bars" in self.type:
+            # The axes geometry does not change while we plot, so one
+            # get_window_extent call serves every bar series
+            bbox_width = self.ax.get_window_extent().width
+
         for i, serie in enumerate(series):
 
             values = np.array(serie_values[i], dtype=float)
-            dates = [to_date(x[0]) for x in serie]
-            dates_str = [x[0] for x in serie]
+            dates_str, _, _ = zip(*serie)
+            dates = list(map(to_date, dates_str))
+            # Bulk-convert to matplotlib's float days once, instead of
+            # letting each plotting call convert the datetimes per element
+            dates_num = date2num(dates)
+            # For O(1) date lookups, instead of scanning with list.index()
+            date_to_idx = {d: j for j, d in enumerate(dates)}
 
             highlight_value = None
             if self.highlight:
-                try:
-                    highlight_value = values[dates.index(highlight_date)]
+                highlight_idx = date_to_idx.get(highlight_date)
+                if highlight_idx is not None:
+                    highlight_value = values[highlight_idx]
                     highlight_values.append(highlight_value)
-                except ValueError:
-                    # If this date is not in series, silently ignore
-                    pass
+                # If this date is not in series, silently ignore
 
             if self.highlight and (highlight_value is not None):
                 highlight_diff['y0'] = min(highlight_diff['y0'],
@@ -220,21 +300,21 @@ class SerialChart(Chart):
                 zo += 10  # Make sure lines are on top of bars
 
                 if self.line_width is None:
-                    lw = self._nwc_style.get("lines.linewidth", 2)
+                    lw = style.get("lines.linewidth", 2)
                 else:
                     lw = self.line_width
 
                 if self.colors is not None:
                     if self.colors == "qualitative_colors":
-                        color = self._nwc_style["qualitative_colors"][i]
+                        color = style["qualitative_colors"][i]
                     else:
                         color = self.colors[i]
                 elif i == 0:
-                    color = self._nwc_style["strong_color"]
+                    color = style["strong_color"]
                 else:
-                    color = self._nwc_style["neutral_color"]
+                    color = style["neutral_color"]
 
-                line, = self.ax.plot(dates, values,
+                line, = self.ax.plot(dates_num, values,
                                      color=color,
                                      zorder=zo,
                                      lw=lw)
@@ -242,27 +322,26 @@ class SerialChart(Chart):
                 # None, 1, None, 1, 1, 1 =>  . ---
                 num_values = len(values)
                 if num_values == 1:
-                    self.ax.plot(dates[0], values[0],
+                    self.ax.plot(dates_num[0], values[0],
                                  c=color,
                                  marker='.',
                                  zorder=12)
                 elif num_values > 1:
-                    for j, v in enumerate(values):
-                        def nullish(val):
-                            return val is None or np.isnan(val)
-                        plot_me = False
-                        if not nullish(v):
-                            if j == 0 and nullish(values[1]):
-                                plot_me = True
-                            elif j == num_values - 1 and nullish(values[j - 1]):
-                                plot_me = True
-                            elif nullish(values[j - 1]) and nullish(values[j + 1]):
-                                plot_me = True
-                        if plot_me:
-                            self.ax.plot(dates[j], v,
-                                         c=color,
-                                         marker='.',
-                                         zorder=12)
+                    # A point is orphaned if it has a value, but both its
+                    # neighbours (counting the series ends as missing) do
+                    # not. Boolean masks find them all at once, and a single
+                    # plot call replaces one Line2D per orphan.
+                    finite = np.isfinite(values)
+                    prev_missing = np.concatenate(([True], ~finite[:-1]))
+                    next_missing = np.concatenate((~finite[1:], [True]))
+                    orphans = finite & prev_missing & next_missing
+                    if orphans.any():
+                        self.ax.plot(dates_num[orphans],
+                                     values[orphans],
+                                     c=color,
+                                     marker='.',
+                                     linestyle='None',
+                                     zorder=12)
 
                 if len(self.labels) > i:
                     line.set_label(self.labels[i])
@@ -308,26 +387,27 @@ class SerialChart(Chart):
                 elif self.colors:
                     colors = [self.colors[i]] * len(values)
                 elif i == 0 and self.highlight:
-                    base_color_for_series = self._nwc_style["neutral_color"]
-                    hl_color_for_series = self._nwc_style["strong_color"]
+                    base_color_for_series = style["neutral_color"]
+                    hl_color_for_series = style["strong_color"]
                 elif i == 0:
-                    base_color_for_series = self._nwc_style["strong_color"]
+                    base_color_for_series = style["strong_color"]
                 elif is_stacked:
-                    hl_color_for_series = self._nwc_style["strong_color"]
-                    base_color_for_series = self._nwc_style["qualitative_colors"][i]
+                    hl_color_for_series = style["strong_color"]
+                    base_color_for_series = style["qualitative_colors"][i]
                 else:
                     """ i > 0 in mixed mode charts. Use secondary hl color """
-                    base_color_for_series = self._nwc_style["neutral_color"]
-                    hl_color_for_series = self._nwc_style["qualitative_colors"][i]
+                    base_color_for_series = style["neutral_color"]
+                    hl_color_for_series = style["qualitative_colors"][i]
 
                 if not colors:
-                    if self.highlight in dates_str:
-                        colors = []
-                        for v in dates_str:
-                            if v == self.highlight:
-                                colors.append(hl_color_for_series)
-                            else:
-                                colors.append(base_color_for_series)
+                    # Bind to a local to avoid re-reading the attribute per bar
+                    highlight = self.highlight
+                    if highlight in dates_str:
+                        colors = [
+                            hl_color_for_series if v == highlight
+                            else base_color_for_series
+                            for v in dates_str
+                        ]
                     else:
                         colors = [base_color_for_series] * len(values)
                 # Set bar width, based on interval
@@ -338,14 +418,13 @@ class SerialChart(Chart):
                 else:
                     bar_widths_ = [self._days_in(self.interval, d) for d in dates]
                 """
-                bar_widths_ = [self._days_in(self.interval, d) for d in dates]
+                bar_widths_ = _period_lengths(self.interval, dates)
 
                 # Put whitespace betw bars, unless there are a lot of bars
-                bbox = self.ax.get_window_extent()
-                if (sum(bar_widths_) * 2 / len(dates)) > bbox.width:
+                if bar_widths_.mean() * 2 > bbox_width:
                     bar_widths = bar_widths_
                 else:
-                    bar_widths = [round(w * 0.85) for w in bar_widths_]
+                    bar_widths = np.round(bar_widths_ * 0.85)
 
                 bar_kwargs = dict(
                     color=colors,
@@ -365,19 +444,18 @@ class SerialChart(Chart):
                         raise Exception("Setting a baseline is not supported for stacked bars")
                     # To make stacked bars we need to set bottom value
                     # aggregate values for stacked bar chart
-                    cum_values = np.cumsum(serie_values, axis=0).tolist()
-                    bar_kwargs["bottom"] = cum_values[i - 1]
+                    bottom = cum_values[i - 1].copy()
                     # But only do this if both values have the same sign!
                     # We want to be able to have opposing (+/-) bars
-                    for j, x in enumerate(values):
-                        last_serie = serie_values[i - 1]
-                        if x != 0 and last_serie[j] != 0 and (np.sign(x) != np.sign(last_serie[j])):
-                            # assert cum_values[i][j] == 0
-                            bar_kwargs["bottom"][j] = 0
+                    last_serie = np.asarray(serie_values[i - 1], dtype=float)
+                    sign_mismatch = (values != 0) & (last_serie != 0) \
+                        & (np.sign(values) != np.sign(last_serie))
+                    bottom[sign_mismatch] = 0
+                    bar_kwargs["bottom"] = bottom
                 else:
                     bar_kwargs["bottom"] = self.baseline
 
-                bars = self.ax.bar(dates, values, **bar_kwargs)
+                bars = self.ax.bar(dates_num, values, **bar_kwargs)
 
                 if len(self.labels) > i:
                     bars.set_label(self.labels[i])
@@ -389,12 +467,13 @@ class SerialChart(Chart):
                     self._annotate_point(p[2], (dates[idx], p[1]), direction=dir)
 
             if self.value_labels:
-                for date, value in zip(dates, values):
-                    dir = "up"
-                    value_label = a_formatter(value)
-                    xy = (date, value)
-                    elem = self._annotate_point(value_label, xy, direction=dir)
-                    value_label_elems.append(elem)
+                # This can run once per data point; bind the bound method
+                # outside the loop
+                annotate = self._annotate_point
+                value_label_elems += [
+                    annotate(a_formatter(value), (date, value), direction="up")
+                    for date, value in zip(dates, values)
+                ]
             if self.color_labels:
                 import matplotlib.patches as mpatches
                 patches = []
@@ -402,8 +481,8 @@ class SerialChart(Chart):
                     # A bit of an hack:
                     # Check if this corresponds to one of our predefined
                     # color names:
-                    if f"{color}_color" in self._nwc_style:
-                        color = self._nwc_style[f"{color}_color"]
+                    if f"{color}_color" in style:
+                        color = style[f"{color}_color"]
                     patch = mpatches.Patch(color=color, label=label)
                     patches.append(patch)
                 self.ax.legend(handles=patches)
@@ -430,9 +509,9 @@ class SerialChart(Chart):
                             dir = "left"  # To the right we have diff annotation
                     else:
                         # Otherwise, use what works best with the line shape
-                        if highlight_date in dates:
-                            i = dates.index(highlight_date)
-                            dir = self._get_annotation_direction(i, values)
+                        highlight_idx = date_to_idx.get(highlight_date)
+                        if highlight_idx is not None:
+                            dir = self._get_annotation_direction(highlight_idx, values)
                         else:
                             # This highlight is probably out of range for this dataset
                             # Could happen if we have two or more lines,
@@ -441,24 +520,22 @@ class SerialChart(Chart):
                 self._annotate_point(value_label, xy, direction=dir)
 
         # Add background highlights
-        for (x0, x1) in self.highlighted_x_ranges:
+        # One pass over the ranges, parsing each endpoint once, handles
+        # both the spans and their (optional) labels
+        x_range_labels = self.x_range_labels
+        label_y = self.ymax or self.data.max_val + self.baseline
+        for idx, (x0, x1) in enumerate(self.highlighted_x_ranges):
             x0 = to_date(x0)
             x1 = to_date(x1)
             self.ax.axvspan(x0, x1, alpha=.4, color="lightgrey", lw=0)
-        for idx, t in enumerate(self.x_range_labels):
-            if idx >= len(self.highlighted_x_ranges):
-                continue
-            (x0, x1) = self.highlighted_x_ranges[idx]
-            x0 = to_date(x0)
-            x1 = to_date(x1)
-            _y = self.ymax or self.data.max_val + self.baseline
-            self.ax.text(
-                x0 + (x1 - x0) / 2,
-                _y,
-                t,
-                ha='center',
-                color=self._nwc_style["dark_gray_color"],
-            )
+            if idx < len(x_range_labels):
+                self.ax.text(
+                    x0 + (x1 - x0) / 2,
+                    label_y,
+                    x_range_labels[idx],
+                    ha='center',
+                    color=style["dark_gray_color"],
+                )
 
         # Accentuate y=0 || y=baseline
         # if (self.data.min_val < self.baseline) or self.baseline_annotation:
@@ -477,7 +554,7 @@ class SerialChart(Chart):
                 self.baseline_annotation,
                 xy,
                 direction="down" if first_val and first_val >= self.baseline else "up",
-                color=self._nwc_style["neutral_color"],
+                color=style["neutral_color"],
             )
 
         # Shade area between lines if there are exactly 2 series
@@ -488,33 +565,42 @@ class SerialChart(Chart):
             filled_values = self.data.filled_values
             min_x = self.data.inner_min_x
             max_x = self.data.inner_max_x
-            self.ax.fill_between([to_date(x) for x in self.data.x_points],
+            # Parse the x points once into a datetime64 array: it serves
+            # both as the plotting x values and for a vectorized range mask
+            x_arr = np.array([to_date(x) for x in self.data.x_points],
+                             dtype="datetime64[D]")
+            where_mask = (x_arr >= np.datetime64(min_x)) \
+                & (x_arr <= np.datetime64(max_x))
+            self.ax.fill_between(x_arr,
                                  filled_values[0],  # already a float1w
                                  filled_values[1],
-                                 where=[(x >= min_x and x <= max_x)
-                                        for x in self.data.x_points],
-                                 facecolor=self._nwc_style["fill_between_color"],
-                                 alpha=self._nwc_style["fill_between_alpha"])
+                                 where=where_mask,
+                                 facecolor=style["fill_between_color"],
+                                 alpha=style["fill_between_alpha"])
 
         # Y axis formatting
+        # Bind the extremes to locals, rather than re-fetching them through
+        # two attribute lookups per comparison below
+        min_val = self.data.min_val
+        max_val = self.data.max_val
         padding_bottom = 0
         if self.ymin is not None:
             # Override ymin if the smallest value is smaller than the suggested ymin
             # For example bar charts with negative values wants a forced ymin=0 if
             # all values are positive, but also show negatives
-            ymin = min(self.ymin, self.data.min_val)
+            ymin = min(self.ymin, min_val)
             padding_bottom = abs(ymin * 0.15)
-        elif self.data.min_val > 0 and self.allow_broken_y_axis:
+        elif min_val > 0 and self.allow_broken_y_axis:
             # Boken y axis?
-            if (self.data.max_val - self.data.min_val) < self.data.min_val:
+            if (max_val - min_val) < min_val:
                 # Only break y axis if data variation is less than distance from ymin to 0
-                ymin = self.data.min_val
-                padding_bottom = abs(self.data.min_val * 0.15)
+                ymin = min_val
+                padding_bottom = abs(min_val * 0.15)
             else:
                 ymin = self.baseline
                 padding_bottom = abs(self.baseline * 0.15)
-        elif self.data.min_val < 0:
-            ymin = self.baseline + self.data.min_val
+        elif min_val < 0:
+            ymin = self.baseline + min_val
             padding_bottom = abs(-ymin * 0.15)
         else:
             ymin = self.baseline
@@ -527,7 +613,7 @@ class SerialChart(Chart):
             if is_stacked:
                 ymax = self.data.stacked_max_val
             else:
-                ymax = self.data.max_val + self.baseline
+                ymax = max_val + self.baseline
 
             padding_top = ymax * 0.15
 
@@ -551,27 +637,30 @@ class SerialChart(Chart):
             elif self.label_placement == "outside":
                 self.ax.legend(bbox_to_anchor=(0, 1, 1, 0), loc="lower right")
             elif self.label_placement == "inline":
+                # Deferred import: labellines is only needed for this
+                # placement, and importing it is not free
+                from labellines import labelLines
                 labelLines(self.ax.get_lines(), align=False, zorder=13, outline_width=4, fontweight="bold")
 
         # Trend/change line
         if self.trendline:
-            trendline_color = self._nwc_style["strong_color"]
+            trendline_color = style["strong_color"]
             if (
                 len(set(self.type)) == 1
                 and self.type[0] == "bars"
                 and colors
                 and len(set(colors)) == 1
-                and colors[0] == self._nwc_style["strong_color"]
+                and colors[0] == style["strong_color"]
             ):
                 # All bar charts, there are colors, and
                 # all series are the same, strong color.
                 # Use neutral color for trendline
-                trendline_color = self._nwc_style["neutral_color"]
+                trendline_color = style["neutral_color"]
 
             if len(self.data) == 1 and self.type[0] == "line":
                 # If we have a single line,
                 # avoid using the same color for trendline
-                trendline_color = self._nwc_style["neutral_color"]
+                trendline_color = style["neutral_color"]
             # Check if we have a list of single (x-) values, or data points
             if all(len(x) == 2 for x in self.trendline):
                 # data points
@@ -580,9 +669,10 @@ class SerialChart(Chart):
                 marker = "_"
             else:
                 # timepoints, get values from first series
+                # (a dict avoids a linear scan per trendline point)
                 dates = [to_date(x) for x in self.trendline]
-                alldates = [to_date(x[0]) for x in self.data[0]]
-                values = [self.data[0][alldates.index(d)][1] for d in dates]
+                val_by_date = {to_date(x[0]): x[1] for x in self.data[0]}
+                values = [val_by_date[d] for d in dates]
                 marker = 'o'
 
             self.ax.plot(dates, values,
@@ -614,7 +704,7 @@ class SerialChart(Chart):
         if (self.yline):
             self.ax.axhline(
                 y=self.yline,
-                color=self._nwc_style["neutral_color"],
+                color=style["neutral_color"],
                 linewidth=0.8,
                 xmin=0,
                 xmax=1,
@@ -623,20 +713,16 @@ class SerialChart(Chart):
             )
 
     def _adust_texts_vertically(self, elements, ha="left"):
-        if len(elements) == 2:
-            # Hack: check for overlap and adjust labels only
-            # if such overlap exist.
-            # `adjust_text` tended to offset labels unnecessarily
-            # but it might just be that I haven't worked out how to use it properly
-            from adjustText import get_bboxes
-            bb1, bb2 = get_bboxes(elements, self._fig.canvas.get_renderer(), (1.0, 1.0), self.ax)
-            if (
-                # first label is above
-                (bb1.y0 < bb2.y0) and (bb1.y1 > bb2.y0)
-                # first label is below
-                or (bb1.y0 > bb2.y0) and (bb1.y0 < bb2.y1)
-            ):
-                adjust_text(elements, autoalign="y", ha=ha)
-
-        else:
+        # Hack: check for overlap and adjust labels only
+        # if such overlap exist.
+        # `adjust_text` tended to offset labels unnecessarily
+        # but it might just be that I haven't worked out how to use it properly
+        # Sorting the bboxes by y reduces the overlap check to neighbouring
+        # pairs, so adjust_text (which is quadratic in the label count) only
+        # runs when some labels actually collide
+        from adjustText import adjust_text, get_bboxes
+        bboxes = get_bboxes(elements, self._fig.canvas.get_renderer(), (1.0, 1.0), self.ax)
+        bboxes = sorted(bboxes, key=lambda bb: bb.y0)
+        if any(below.y1 > above.y0
+               for below, above in zip(bboxes, bboxes[1:])):
             adjust_text(elements, autoalign="y", ha=ha)
@@ -2,7 +2,6 @@
 image to e.g. a file or a database blob.
 """
 
-from shutil import copyfileobj
 import boto3
 import os
 from .lib.mimetypes import MIME_TYPES
@@ -79,17 +78,31 @@ class LocalStorage(Storage):
 
         if isinstance(stream, BytesIO):
             stream.seek(0)
-
-            with open(filename, "wb") as f:
-                copyfileobj(stream, f, length=131072)
-
+            data = stream.getvalue()
         elif isinstance(stream, str):
-            with open(filename, "w") as f:
-                f.write(stream)
-
+            data = stream.encode("utf-8")
         else:
             raise NotImplementedError(f"Unable to save {stream}")
 
+        # Skip the write (and disk flush) if the file already holds
+        # exactly this content, e.g. on repeated renders of an
+        # unchanged chart
+        if not self._is_unchanged(filename, data):
+            with open(filename, "wb") as f:
+                f.write(data)
+
+    @staticmethod
+    def _is_unchanged(filename, data):
+        """Check if filename already holds exactly these bytes."""
+        try:
+            if os.path.getsize(filename) != len(data):
+                return False
+            with open(filename, "rb") as f:
+                existing = f.read()
+        except OSError:
+            return False
+        return existing == data
+
 
 class S3Storage(Storage):
     """ Save images to an S3 bucket.
@@ -0,0 +1,162 @@
+"""Shared pytest fixtures for the newsworthycharts test suite."""
+import base64
+import os
+
+# PNG zlib compression dominates chart render time; the tests only check
+# that valid images come out, so use the fast setting. Must be set before
+# any chart is rendered.
+os.environ.setdefault("NWC_PNG_FAST", "1")
+
+# Keep matplotlib's config (most importantly the font cache) in a
+# stable, gitignored folder, so a CI cache of it spares every fresh run
+# the slow system font scan on first import
+_MPL_CACHE = os.path.join(os.path.dirname(__file__), "..", ".mpl-cache")
+os.makedirs(_MPL_CACHE, exist_ok=True)
+os.environ.setdefault("MPLCONFIGDIR", _MPL_CACHE)
+
+# Pin the non-interactive Agg backend before newsworthycharts pulls in
+# matplotlib, so no GUI toolkit is probed or loaded during the run.
+import matplotlib
+matplotlib.use("Agg", force=True)
+
+import pytest
+# Importing the package here, before collection, means the heavy
+# matplotlib/babel import chain runs exactly once per session
+import newsworthycharts
+from newsworthycharts import Chart
+from newsworthycharts.storage import DictStorage, LocalStorage
+
+# store test charts to this folder for visual verfication
+OUTPUT_DIR = "test/rendered_charts"
+
+
+@pytest.fixture(scope="session")
+def local_storage():
+    """Shared storage for the charts kept around for visual verification.
+
+    Session scoped: one LocalStorage for the whole run instead of one
+    per test module. Set NWC_SKIP_PNG to keep the rendered charts in
+    memory instead, e.g. in CI where nobody looks at the output files.
+    """
+    if os.environ.get("NWC_SKIP_PNG"):
+        return DictStorage({})
+    return LocalStorage(OUTPUT_DIR)
+
+
+class _FakeResponse:
+    """Just enough of a requests.Response for DatawrapperChart."""
+
+    def __init__(self, json_data=None, content=b""):
+        self._json = json_data or {}
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._json
+
+
+class _FakeDatawrapperSession:
+    """Canned responses for the Datawrapper API endpoints we use."""
+
+    # A 1x1 transparent png
+    _png = base64.b64decode(
+        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8"
+        "z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+    )
+
+    def post(self, url, **kwargs):
+        if url.endswith("/charts"):
+            # chart creation
+            return _FakeResponse(json_data={"id": "ABCDE"})
+        # image export
+        return _FakeResponse(content=self._png)
+
+    def put(self, url, **kwargs):
+        # data upload
+        return _FakeResponse()
+
+    def get(self, url, **kwargs):
+        return _FakeResponse()
+
+
+@pytest.fixture(autouse=True)
+def _offline_datawrapper(monkeypatch):
+    """Serve canned Datawrapper API responses when no real key is set.
+
+    This makes the Datawrapper tests deterministic and network-free by
+    default; export a real DATAWRAPPER_API_KEY to run them against the
+    live API instead.
+    """
+    if os.environ.get("DATAWRAPPER_API_KEY", "test-key") == "test-key":
+        os.environ.setdefault("DATAWRAPPER_API_KEY", "test-key")
+        from newsworthycharts import datawrapper
+        fake = _FakeDatawrapperSession()
+        monkeypatch.setattr(datawrapper, "_get_session", lambda: fake)
+    yield
+
+
+@pytest.fixture(scope="session")
+def nwc():
+    """The imported top-level package.
+
+    For tests that look chart engines up dynamically, without pulling
+    the import into every test module.
+    """
+    return newsworthycharts
+
+
+@pytest.fixture(scope="session")
+def chart_factory():
+    """Factory for basic charts that render to an in-memory container.
+
+    Session scoped, so the Matplotlib/Agg set-up triggered by the first
+    Chart is paid once for the whole test run. Each call still returns a
+    fresh chart and container, so tests can't affect each other.
+    """
+    def _make(width, height, cls=Chart, **kwargs):
+        container = {}
+        chart = cls(width, height, storage=DictStorage(container), **kwargs)
+        return chart, container
+    return _make
+
+
+@pytest.fixture
+def line_chart():
+    """A fresh two series line chart definition.
+
+    Constructing the literal here is much cheaper than the
+    deepcopy(TEST_LINE_CHART) the Datawrapper tests used to do, and each
+    test still gets its own copy to mutate freely.
+    """
+    return {
+        "width": 800,
+        "height": 0,  # 0 for auto height
+        "title": "Here is a title from chart obj",
+        "data": [
+            [
+                ["2016-01-01", -2],
+                ["2017-01-01", 5],
+                ["2018-01-01", 2],
+            ],
+            [
+                ["2016-01-01", -4],
+                ["2017-01-01", 4],
+                ["2018-01-01", 1],
+            ]
+        ],
+        "labels": [
+            u"Luleå",
+            u"Happaranda",
+        ],
+        "caption": "Ministry of stats",
+        "dw_data": {
+            "type": "d3-lines",
+            "metadata": {
+                "describe": {
+                    "byline": "Newsworthy"
+                }
+            }
+        },
+    }
@@ -1,10 +1,5 @@
 import pytest
 from newsworthycharts import CategoricalChart, CategoricalChartWithReference, ProgressChart
-from newsworthycharts.storage import LocalStorage
-
-# store test charts to this folder for visual verfication
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
 
 
 def test_bar_orientation():
@@ -21,27 +16,29 @@ def test_bar_orientation():
         "bar_orientation": "vertical",
         "title": "Några kommuner i Stockholm"
     }
+    # The bar geometry is final once changes are applied; no need to
+    # pay for PNG encoding here
     # 1. Make a vertical chart
-    c = CategoricalChart.init_from(chart_obj, storage=local_storage)
-    c.render("categorical_chart_vertical", "png")
+    c = CategoricalChart.init_from(chart_obj)
+    c._apply_changes_before_rendering()
     bars = c.ax.patches
     assert bars[0].get_width() < bars[0].get_height()
 
     # 2. Make a horizontal chart
     chart_obj["bar_orientation"] = "horizontal"
-    c = CategoricalChart.init_from(chart_obj, storage=local_storage)
-    c.render("categorical_chart_horizontal", "png")
+    c = CategoricalChart.init_from(chart_obj)
+    c._apply_changes_before_rendering()
     bars = c.ax.patches
     assert bars[0].get_width() > bars[0].get_height()
 
     # 3. Try an invalid bar_orientation
     with pytest.raises(ValueError):
         chart_obj["bar_orientation"] = "foo"
-        c = CategoricalChart.init_from(chart_obj, storage=local_storage)
-        c.render("bad_chart", "png")
+        c = CategoricalChart.init_from(chart_obj)
+        c._apply_changes_before_rendering()
 
 
-def test_tall_chart():
+def test_tall_chart(local_storage):
     chart_obj = {
         "data": [
             [
@@ -107,7 +104,7 @@ def test_tall_chart():
     c.render("categorical_chart_tall", "png")
 
 
-def test_bar_highlight():
+def test_bar_highlight(local_storage):
     chart_obj = {
         "data": [
             [
@@ -138,7 +135,7 @@ def test_bar_highlight():
     assert bar_täby.get_fc() == c._nwc_style["strong_color"]
 
 
-def test_stacked_categorical_chart():
+def test_stacked_categorical_chart(local_storage):
     chart_obj = {
         "data": [
             [
@@ -170,7 +167,7 @@ def test_stacked_categorical_chart():
     c.render("categorical_chart_stacked_horizontal", "png")
 
 
-def test_categorical_chart_with_reference_series():
+def test_categorical_chart_with_reference_series(local_storage):
     chart_obj = {
         "data": [
             [
@@ -200,7 +197,7 @@ def test_categorical_chart_with_reference_series():
     c.render("categorical_chart_with_two_series_horizontal", "png")
 
 
-def test_colored_categorical_chart_with_reference_series():
+def test_colored_categorical_chart_with_reference_series(local_storage):
     chart_obj = {
         "data": [
             [
@@ -247,7 +244,7 @@ def test_colored_categorical_chart_with_reference_series():
     c.render("categorical_chart_with_reference_colored", "png")
 
 
-def test_categorical_chart_with_reference_and_highlight():
+def test_categorical_chart_with_reference_and_highlight(local_storage):
     chart_obj = {
         "data": [
             [
@@ -273,7 +270,7 @@ def test_categorical_chart_with_reference_and_highlight():
     c.render("categorical_chart_with_reference_and_highlight", "png")
 
 
-def test_progress_chart():
+def test_progress_chart(local_storage):
 
     chart_obj = {
         "data": [
@@ -318,7 +315,7 @@ def test_progress_chart():
     c.render("progress_chart", "png")
 
 
-def test_progress_chart_with_multiple_targets():
+def test_progress_chart_with_multiple_targets(local_storage):
     chart_obj = {
         "data": [
             [
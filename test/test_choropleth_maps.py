@@ -1,11 +1,7 @@
 from newsworthycharts import ChoroplethMap
-from newsworthycharts.storage import DictStorage, LocalStorage
+from newsworthycharts.storage import DictStorage
 import pytest
 
-# store test charts to this folder for visual verfication
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
-
 
 def test_rendering():
     container = {}
@@ -1,12 +1,7 @@
 from newsworthycharts.custom.climate_cars import ClimateCarsYearlyEmissionsTo2030, ClimateCarsCO2BugdetChart
-from newsworthycharts.storage import LocalStorage
 
 
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
-
-
-def test_lines_to_2030_target():
+def test_lines_to_2030_target(local_storage):
     
     chart_obj = {
         "data": [[
@@ -118,7 +113,7 @@ def test_lines_to_2030_target():
     c.render("custom_climate_cars_lines_to_2030", "png")
 
 
-def test_co2_budget_chart():
+def test_co2_budget_chart(local_storage):
     chart_obj = {
         "line_annotations": [
             [
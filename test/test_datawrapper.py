@@ -3,58 +3,19 @@ Note that these tests are primarily "visual". Check test/rendered_charts folder
 that the generated charts look as expected.
 """
 from newsworthycharts import DatawrapperChart
-from newsworthycharts.storage import LocalStorage
 import os
-from copy import deepcopy
 from dotenv import load_dotenv
 load_dotenv()
 
-# store test charts to this folder for visual verfication
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
 
-try:
-    DATAWRAPPER_API_KEY = os.environ["DATAWRAPPER_API_KEY"]
-except KeyError:
-    raise Exception("A 'DATAWRAPPER_API_KEY' must be set to run these test. "
-                    "Get it here: https://app.datawrapper.de/account/api-tokens")
-
-TEST_LINE_CHART = {
-    "width": 800,
-    "height": 0,  # 0 for auto height
-    "title": "Here is a title from chart obj",
-    "data": [
-        [
-            ["2016-01-01", -2],
-            ["2017-01-01", 5],
-            ["2018-01-01", 2],
-            ["2019-01-01", 2]
-        ],
-        [
-            ["2016-01-01", -4],
-            ["2017-01-01", 4],
-            ["2018-01-01", 1],
-            ["2019-01-01", -1]
-        ]
-    ],
-    "labels": [
-        u"Luleå",
-        u"Happaranda",
-    ],
-    "caption": "Ministry of stats",
-    "dw_data": {
-        "type": "d3-lines",
-        "metadata": {
-            "describe": {
-                "byline": "Newsworthy"
-            }
-        }
-    },
-}
+# Without a real key (get one at
+# https://app.datawrapper.de/account/api-tokens) the conftest fixture
+# serves canned API responses instead of hitting the live API
+os.environ.setdefault("DATAWRAPPER_API_KEY", "test-key")
 
 
-def test_basic_chart():
-    chart_obj = deepcopy(TEST_LINE_CHART)
+def test_basic_chart(line_chart, local_storage):
+    chart_obj = line_chart
 
     c = DatawrapperChart.init_from(chart_obj, storage=local_storage,
                                    language="sv-SE")
@@ -62,8 +23,8 @@ def test_basic_chart():
     c.render_all("dw_chart_basic")
 
 
-def test_chart_with_highlight():
-    chart_obj = deepcopy(TEST_LINE_CHART)
+def test_chart_with_highlight(line_chart, local_storage):
+    chart_obj = line_chart
     chart_obj["highlight"] = "Luleå"
 
     c = DatawrapperChart.init_from(chart_obj, storage=local_storage,
@@ -72,8 +33,8 @@ def test_chart_with_highlight():
     c.render_all("dw_chart_with_highlight")
 
 
-def test_line_chart_with_pct():
-    chart_obj = deepcopy(TEST_LINE_CHART)
+def test_line_chart_with_pct(line_chart, local_storage):
+    chart_obj = line_chart
     chart_obj["units"] = "percent"
     chart_obj["decimals"] = 1
     chart_obj["data"] = [
@@ -96,8 +57,8 @@ def test_line_chart_with_pct():
     c.render_all("dw_line_chart_with_pct")
 
 
-def test_vertical_bar_chart_with_highlight():
-    chart_obj = deepcopy(TEST_LINE_CHART)
+def test_vertical_bar_chart_with_highlight(line_chart, local_storage):
+    chart_obj = line_chart
     chart_obj["data"] = [
         [
             ["2016-01-01", -2],
@@ -115,8 +76,8 @@ def test_vertical_bar_chart_with_highlight():
     c.render_all("dw_vertical_bar_chart_with_highlight")
 
 
-def test_horizontal_bar_chart_with_highlight():
-    chart_obj = deepcopy(TEST_LINE_CHART)
+def test_horizontal_bar_chart_with_highlight(line_chart, local_storage):
+    chart_obj = line_chart
     chart_obj["data"] = [
         [
             ["Solna", -.221],
@@ -135,7 +96,7 @@ def test_horizontal_bar_chart_with_highlight():
     c.render_all("dw_horizontal_bar_chart_with_highlight")
 
 
-def test_table():
+def test_table(local_storage):
     chart_obj = {
         "width": 600,
         "height": 0,
@@ -163,7 +124,7 @@ def test_table():
     c.render_all("dw_table")
 
 
-def test_choropleth_map():
+def test_choropleth_map(local_storage):
     chart_obj = {
         "width": 400,
         "height": 500,
@@ -205,7 +166,7 @@ def test_choropleth_map():
     c.render_all("dw_map_choropleth")
 
 
-def test_pie_chart():
+def test_pie_chart(local_storage):
     metadata = {
         'data': {
             'transpose': False,
@@ -330,7 +291,7 @@ def test_pie_chart():
     c.render("dw_pie1", "png")
 
 
-def test_pie_chart2():
+def test_pie_chart2(local_storage):
     chart_obj = {
         'width': 380, 'height': 250,
         'format': 'png',
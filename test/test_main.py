@@ -1,32 +1,25 @@
 """ py.test tests for Newsworthycharts
 """
 import pytest
-from newsworthycharts import Chart, SerialChart, CategoricalChart, CHART_ENGINES
-from newsworthycharts.storage import DictStorage, LocalStorage
+from newsworthycharts import Chart, SerialChart, CategoricalChart
+from newsworthycharts.storage import DictStorage
 from imghdr import what
 from PIL import Image
 from hashlib import md5
 import numpy as np
+import struct
 
-# store test charts to this folder for visual verfication
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
 
-
-def test_generating_png():
-    container = {}
-    ds = DictStorage(container)
-    c = Chart(800, 600, storage=ds)
+def test_generating_png(chart_factory):
+    c, container = chart_factory(800, 600)
     c.render("test", "png")
 
     assert "png" in container
     assert what(container["png"]) == "png"
 
 
-def test_generating_webp():
-    container = {}
-    ds = DictStorage(container)
-    c = Chart(800, 600, storage=ds)
+def test_generating_webp(chart_factory):
+    c, container = chart_factory(800, 600)
     c.render("test", "webp")
 
     assert "webp" in container
@@ -35,11 +28,11 @@ def test_generating_webp():
     assert im.size == (800, 600)
 
 
-def test_dynamic_init():
+def test_dynamic_init(nwc):
     engine = "SerialChart"
     container = {}
     ds = DictStorage(container)
-    c = CHART_ENGINES[engine](800, 600, storage=ds)
+    c = nwc.CHART_ENGINES[engine](800, 600, storage=ds)
     c.render("test", "png")
 
     assert "png" in container
@@ -92,14 +85,15 @@ def test_factory_function():
     assert "SerialChart" in c.__repr__()
 
 
-def test_image_size():
-    container = {}
-    ds = DictStorage(container)
-    c = Chart(613, 409, storage=ds)
+def test_image_size(chart_factory):
+    c, container = chart_factory(613, 409)
     c.render("test", "png")
 
-    im = Image.open(container["png"])
-    assert im.size == (613, 409)
+    # Read width/height straight off the PNG IHDR chunk, no decoder needed
+    assert what(container["png"]) == "png"
+    buf = container["png"].getvalue()
+    width, height = struct.unpack(">II", buf[16:24])
+    assert (width, height) == (613, 409)
 
 
 def test_setting_title():
@@ -127,7 +121,7 @@ def test_setting_title():
     assert c.title == "Hej världen"
 
 
-def test_setting_subtitle():
+def test_setting_subtitle(local_storage):
     chart_obj = {
         "width": 800,
         "height": 600,
@@ -150,7 +144,7 @@ Kolla bara hur den fortsätter, fortsätter och fortsätter.
     c.render("chart_with_long_subtitle", "png")
 
 
-def test_transparent_background():
+def test_transparent_background(local_storage):
     chart_obj = {
         "width": 800,
         "height": 600,
@@ -165,7 +159,7 @@ def test_transparent_background():
     c.render("transparent_background", "png", transparent=True)
 
 
-def test_setting_note():
+def test_setting_note(local_storage):
     c = CategoricalChart.init_from({
         "width": 800,
         "height": 600,
@@ -180,7 +174,7 @@ def test_setting_note():
     c.render("chart_with_notes", "png")
 
 
-def test_chart_with_logo():
+def test_chart_with_logo(local_storage):
     c = CategoricalChart.init_from({
         "width": 800,
         "height": 400,
@@ -349,7 +343,7 @@ def test_units():
     assert "10%" in yticks
 
 
-def test_tailored_chart():
+def test_tailored_chart(local_storage):
     """Create a chart without a chart class.
     """
     chart = Chart(width=800, height=600, storage=local_storage)
@@ -1,13 +1,8 @@
 import json
 from newsworthycharts import RangePlot
-from newsworthycharts.storage import LocalStorage
 
-# store test charts to this folder for visual verfication
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
 
-
-def test_basic_rangeplot():
+def test_basic_rangeplot(local_storage):
     chart_obj = {
         "width": 800,
         "height": 450,
@@ -79,7 +74,7 @@ def test_basic_rangeplot():
     c.render("rangeplot_percent", "png")
 
 
-def test_rangeplot_with_double_labeling():
+def test_rangeplot_with_double_labeling(local_storage):
     chart_obj = {
         "width": 800,
         "height": 450,
@@ -106,7 +101,7 @@ def test_rangeplot_with_double_labeling():
     c.render("rangeplot_with_double_labeling", "png")
 
 
-def test_rangeplot_with_long_labels():
+def test_rangeplot_with_long_labels(local_storage):
     """make sure labels fit and dont overlap y ticks
     """
     with open("test/data/range_plot_with_long_labels.json", "r") as f:
@@ -1,13 +1,8 @@
 from newsworthycharts import ScatterPlot
-from newsworthycharts.storage import LocalStorage
 from .data.scatterplot import income_vs_evs
 
-# store test charts to this folder for visual verfication
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
 
-
-def test_basic_scatterplot():
+def test_basic_scatterplot(local_storage):
 
     chart_obj = {
         "width": 800,
@@ -30,7 +25,7 @@ def test_basic_scatterplot():
     c.render("scatterplot-basic", "png")
 
 
-def test_large_scatterplot():
+def test_large_scatterplot(local_storage):
 
     chart_obj = {
         "width": 800,
@@ -1,11 +1,7 @@
 from newsworthycharts import SerialChart
-from newsworthycharts.storage import DictStorage, LocalStorage
+from newsworthycharts.storage import DictStorage
 import pytest
 
-# store test charts to this folder for visual verfication
-OUTPUT_DIR = "test/rendered_charts"
-local_storage = LocalStorage(OUTPUT_DIR)
-
 
 def test_color_function():
     container = {}
@@ -27,7 +23,8 @@ def test_color_function():
         "highlight": "2019-01-01",
     }
     c = SerialChart.init_from(chart_obj, storage=ds)
-    c.render("test", "png")
+    # Facecolors are set when changes are applied; skip the PNG encode
+    c._apply_changes_before_rendering()
 
     neutral_color = c._nwc_style["neutral_color"]
     pos_color = c._nwc_style["positive_color"]
@@ -38,9 +35,9 @@ def test_color_function():
     assert bar_colors[2] == neutral_color
     assert bar_colors[3] == neg_color
 
-    chart_obj["color_fn"] = "warm_cold"
-    c = SerialChart.init_from(chart_obj, storage=ds)
-    c.render("test", "png")
+    # Swapping the color rule only changes facecolors, so re-apply it to
+    # the existing bars instead of paying for a second full render
+    c._apply_color_fn("warm_cold")
 
     warm_color = c._nwc_style["warm_color"]
     cold_color = c._nwc_style["cold_color"]
@@ -52,10 +49,16 @@ def test_color_function():
     assert bar_colors[3] == cold_color
 
 
-def test_type_property():
+@pytest.mark.parametrize("chart_type, n_bars", [
+    ("bars", 3),
+    ("line", 0),
+])
+def test_type_property(chart_type, n_bars):
     container = {}
     ds = DictStorage(container)
 
+    # NB: yearly charts need at least a three year span to get an
+    # x axis locator
     chart_obj = {
         "width": 800,
         "height": 600,
@@ -64,28 +67,19 @@ def test_type_property():
                 ["2016-01-01", -4],
                 ["2017-01-01", 4],
                 ["2018-01-01", 1],
-                ["2019-01-01", -1]
             ]
         ],
-        "type": "bars",
+        "type": chart_type,
     }
-    # when type="bars"...
     c = SerialChart.init_from(chart_obj, storage=ds)
-    c.render("test", "png")
-    bars = c.ax.patches
-    # ...4 bars should be rendered
-    assert len(bars) == 4
-
-    # while a type=line...
-    chart_obj["type"] = "line"
-    c = SerialChart.init_from(chart_obj, storage=ds)
-    c.render("test", "png")
-    # lines = c.ax.patches
-    # ... should only render one element
-    # assert(len(lines) == 1)
+    # The patch list is final once changes are applied; skip the
+    # PNG encode
+    c._apply_changes_before_rendering()
+    # type="bars" should render one bar per point, type="line" none
+    assert len(c.ax.patches) == n_bars
 
 
-def test_stacked_bar_chart():
+def test_stacked_bar_chart(local_storage):
     chart_obj = {
         "width": 800,
         "height": 600,
@@ -94,13 +88,11 @@ def test_stacked_bar_chart():
                 ["2016-01-01", 1],
                 ["2017-01-01", 4],
                 ["2018-01-01", None],
-                ["2019-01-01", 2]
             ],
             [
                 ["2016-01-01", 3],
                 ["2017-01-01", 12],
                 ["2018-01-01", 1],
-                ["2019-01-01", None]
             ]
         ],
         "labels": ["the good", "the bad"],
@@ -110,7 +102,7 @@ def test_stacked_bar_chart():
     c = SerialChart.init_from(chart_obj, storage=local_storage)
     c.render("stacked_bar_chart_basic", "png")
     bars = c.ax.patches
-    assert len(bars) == 8
+    assert len(bars) == 6
 
     # Should color with qualitative colors by default
     qualitative_colors = c._nwc_style["qualitative_colors"]
@@ -118,15 +110,16 @@ def test_stacked_bar_chart():
     assert bar_colors[0] == qualitative_colors[0]
     assert bar_colors[-1] == qualitative_colors[1]
 
-    # specify colors
+    # specify colors; the facecolors are all this variant asserts on,
+    # so skip the second PNG encode
     chart_obj["colors"] = ["red", "green"]
-    c = SerialChart.init_from(chart_obj, storage=local_storage)
-    c.render("stacked_bar_chart_spec_colors", "png")
+    c = SerialChart.init_from(chart_obj)
+    c._apply_changes_before_rendering()
     bar_colors = [bar.get_facecolor() for bar in c.ax.patches]
     assert bar_colors[0] == (1.0, 0.0, 0.0, 1.0)  # red
 
 
-def test_bar_chart_with_ymax():
+def test_bar_chart_with_ymax(local_storage):
     # all negative values with fixed ymax to 0
     chart_obj = {
         "width": 800,
@@ -170,7 +163,7 @@ def test_bar_chart_with_ymax():
     assert c.ax.get_ylim()[1] == 1.0
 
 
-def test_serial_chart_with_axis_labels():
+def test_serial_chart_with_axis_labels(local_storage):
     chart_obj = {
         "width": 800,
         "height": 600,
@@ -194,7 +187,7 @@ def test_serial_chart_with_axis_labels():
     c.render("serial_chart_with_axis_labels", "png")
 
 
-def test_chart_with_long_y_ticks():
+def test_chart_with_long_y_ticks(local_storage):
     chart_obj = {
         "width": 800,
         "height": 600,
@@ -214,7 +207,7 @@ def test_chart_with_long_y_ticks():
     c.render("serial_bar_chart_with_long_y_ticks", "png")
 
 
-def test_chart_with_negative_values():
+def test_chart_with_negative_values(local_storage):
     chart_obj = {
         "width": 800,
         "height": 600,
@@ -235,7 +228,7 @@ def test_chart_with_negative_values():
     c.render("serial_bar_chart_with_negative_values", "png")
 
 
-def test_weekly_chart():
+def test_weekly_chart(local_storage):
     # all negative values with fixed ymax to 0
     chart_obj = {
         "width": 800,
@@ -258,7 +251,7 @@ def test_weekly_chart():
     c.render("serial_chart_weekly", "png")
 
 
-def test_multi_color_lines():
+def test_multi_color_lines(local_storage):
     colors = ["red", "green", "blue"]
 
     chart_obj = {
@@ -291,7 +284,7 @@ def test_multi_color_lines():
         assert c.ax.get_lines()[i].get_color() == color
 
 
-def test_qualitative_colors_in_line_chart():
+def test_qualitative_colors_in_line_chart(local_storage):
     chart_obj = {
         "width": 750,
         "height": 550,
@@ -371,7 +364,7 @@ def test_qualitative_colors_in_line_chart():
     #assert line_colors[2] == qualitative_colors[0]
     #assert line_colors[1] == qualitative_colors[1]
 
-def test_value_labeling():
+def test_value_labeling(local_storage):
     chart_obj = {
         "width": 600,
         "height": 300,
@@ -400,7 +393,7 @@ def test_value_labeling():
     c.render("serial_chart_value_labeling", "png")
 
 
-def test_line_labeling():
+def test_line_labeling(local_storage):
     chart_obj = {
         "width": 600,
         "height": 300,
@@ -469,7 +462,7 @@ def test_line_labeling():
     c.render("serial_chart_line_labeling2", "png")
 
 
-def test_inline_labeling():
+def test_inline_labeling(local_storage):
     # real world example
     chart_obj = {
         'data': [
@@ -554,7 +547,7 @@ def test_inline_labeling():
     c.render("serial_chart_inline_labeling", "png")
 
 
-def test_serial_chart_with_highlighted_area():
+def test_serial_chart_with_highlighted_area(local_storage):
     import json
     with open("test/data/elpriser.json") as f:
         series = json.load(f)
@@ -588,7 +581,7 @@ def test_serial_chart_with_highlighted_area():
     c.render("serial_chart_with_highlighted_area", "png")
 
 
-def test_duplicated_timepoint():
+def test_duplicated_timepoint(local_storage):
     chart_obj = {
         'colors': ['#00a39a', '#DBAD58'],
         'data': [
@@ -608,4 +601,3 @@ def test_duplicated_timepoint():
         c.render("serial_barchart", "png")
 
 
-